@@ -76,3 +76,11 @@ class InvalidRequestError(UcpError):
   def __init__(self, message: str):
     """Initialize InvalidRequestError."""
     super().__init__(message, code="INVALID_REQUEST", status_code=400)
+
+
+class FulfillmentRequiredError(InvalidRequestError):
+  """Raised when completing a checkout without a selected fulfillment."""
+
+  def __init__(self, message: str):
+    """Initialize FulfillmentRequiredError."""
+    super().__init__(message)
@@ -283,6 +283,20 @@ class IntegrationTest(absltest.TestCase):
       risk_signals={},
     )
 
+  def _acp_headers(self) -> dict[str, str]:
+    """Construct ACP request headers with a Bearer token."""
+    return {"Authorization": "Bearer test_token"}
+
+  def _create_acp_session(self, sku: str = "rose", quantity: int = 1) -> str:
+    """Create an ACP checkout session and return its id."""
+    response = self.client.post(
+      "/acp/checkout_sessions",
+      headers=self._acp_headers(),
+      json={"items": [{"sku": sku, "quantity": quantity}]},
+    )
+    self.assertEqual(response.status_code, 201, f"Response: {response.text}")
+    return response.json()["id"]
+
   def test_single_item_checkout(self) -> None:
     """Test the full lifecycle of a single item checkout."""
     with self.client:
@@ -494,6 +508,232 @@ class IntegrationTest(absltest.TestCase):
       self.assertEqual(response.status_code, 409)
       self.assertIn("Cannot cancel checkout", response.json()["detail"])
 
+  def test_acp_session_not_found(self) -> None:
+    """Tests that ACP routes return 404 for an unknown checkout session."""
+    with self.client:
+      headers = self._acp_headers()
+      response = self.client.get(
+        "/acp/checkout_sessions/missing", headers=headers
+      )
+      self.assertEqual(response.status_code, 404)
+
+      response = self.client.post(
+        "/acp/checkout_sessions/missing", headers=headers, json={}
+      )
+      self.assertEqual(response.status_code, 404)
+
+      response = self.client.post(
+        "/acp/checkout_sessions/missing/complete",
+        headers=headers,
+        json={"payment_data": {"token": "spt_123", "provider": "stripe"}},
+      )
+      self.assertEqual(response.status_code, 404)
+
+      response = self.client.post(
+        "/acp/checkout_sessions/missing/cancel", headers=headers
+      )
+      self.assertEqual(response.status_code, 404)
+
+  def test_acp_service_errors_keep_status(self) -> None:
+    """Tests that UCP service errors keep their status code over ACP."""
+    with self.client:
+      response = self.client.post(
+        "/acp/checkout_sessions",
+        headers=self._acp_headers(),
+        json={"items": [{"sku": "nope", "quantity": 1}]},
+      )
+      self.assertEqual(response.status_code, 400)
+      self.assertEqual(response.json()["detail"], "Product nope not found")
+
+      session_id = self._create_acp_session()
+      response = self.client.post(
+        f"/acp/checkout_sessions/{session_id}",
+        headers=self._acp_headers(),
+        json={"items": [{"sku": "nope", "quantity": 1}]},
+      )
+      self.assertEqual(response.status_code, 400)
+      self.assertEqual(response.json()["detail"], "Product nope not found")
+
+  def test_acp_complete_requires_fulfillment(self) -> None:
+    """Tests that completing an ACP session without fulfillment fails."""
+    with self.client:
+      session_id = self._create_acp_session()
+      response = self.client.post(
+        f"/acp/checkout_sessions/{session_id}/complete",
+        headers=self._acp_headers(),
+        json={"payment_data": {"token": "spt_123", "provider": "stripe"}},
+      )
+      self.assertEqual(response.status_code, 400)
+      self.assertEqual(
+        response.json()["detail"],
+        "Fulfillment address and option must be selected",
+      )
+
+  def test_acp_cancel_checkout(self) -> None:
+    """Tests ACP cancellation and operations on terminal sessions."""
+    with self.client:
+      session_id = self._create_acp_session()
+      response = self.client.post(
+        f"/acp/checkout_sessions/{session_id}/cancel",
+        headers=self._acp_headers(),
+      )
+      self.assertEqual(response.status_code, 200)
+      self.assertEqual(response.json()["status"], "canceled")
+
+      # Canceling again is not allowed
+      response = self.client.post(
+        f"/acp/checkout_sessions/{session_id}/cancel",
+        headers=self._acp_headers(),
+      )
+      self.assertEqual(response.status_code, 405)
+
+      # Completing a canceled session conflicts
+      response = self.client.post(
+        f"/acp/checkout_sessions/{session_id}/complete",
+        headers=self._acp_headers(),
+        json={"payment_data": {"token": "spt_123", "provider": "stripe"}},
+      )
+      self.assertEqual(response.status_code, 409)
+
+  def test_acp_operations_on_completed_checkout(self) -> None:
+    """Tests ACP cancel and complete on a checkout completed over UCP."""
+    with self.client:
+      payload = self._create_checkout_payload(
+        "test_checkout_acp_completed", [("rose", "Red Rose", 1000, 1)]
+      )
+      response = self.client.post(
+        "/checkout-sessions",
+        headers=self._get_headers(idempotency_key="acp_1", request_id="acp_1"),
+        json=payload.model_dump(mode="json", exclude_none=True),
+      )
+      self.assertEqual(response.status_code, 201)
+
+      payment_payload = self._create_payment_payload()
+      response = self.client.post(
+        "/checkout-sessions/test_checkout_acp_completed/complete",
+        headers=self._get_headers(idempotency_key="acp_2", request_id="acp_2"),
+        json=payment_payload.model_dump(mode="json", exclude_none=True),
+      )
+      self.assertEqual(response.status_code, 200)
+
+      response = self.client.get(
+        "/acp/checkout_sessions/test_checkout_acp_completed",
+        headers=self._acp_headers(),
+      )
+      self.assertEqual(response.status_code, 200)
+      self.assertEqual(response.json()["status"], "complete")
+
+      response = self.client.post(
+        "/acp/checkout_sessions/test_checkout_acp_completed/complete",
+        headers=self._acp_headers(),
+        json={"payment_data": {"token": "spt_123", "provider": "stripe"}},
+      )
+      self.assertEqual(response.status_code, 409)
+
+      response = self.client.post(
+        "/acp/checkout_sessions/test_checkout_acp_completed/cancel",
+        headers=self._acp_headers(),
+      )
+      self.assertEqual(response.status_code, 405)
+
+  def test_acp_body_validation(self) -> None:
+    """Tests ACP request body validation and its error shape."""
+    with self.client:
+      response = self.client.post(
+        "/acp/checkout_sessions",
+        headers=self._acp_headers(),
+        json={"items": []},
+      )
+      self.assertEqual(response.status_code, 422)
+      error = response.json()["detail"][0]
+      self.assertEqual(error["type"], "too_short")
+      self.assertEqual(error["loc"], ["body", "items"])
+
+      response = self.client.post(
+        "/acp/checkout_sessions",
+        headers={**self._acp_headers(), "Content-Type": "application/json"},
+        content=b'{"items": [',
+      )
+      self.assertEqual(response.status_code, 422)
+      self.assertEqual(response.json()["detail"][0]["loc"], ["body"])
+
+      response = self.client.post(
+        "/acp/checkout_sessions", headers=self._acp_headers()
+      )
+      self.assertEqual(response.status_code, 422)
+      self.assertEqual(response.json()["detail"][0]["type"], "missing")
+
+  def test_acp_body_requires_json_content_type(self) -> None:
+    """Tests that ACP bodies sent with a non-JSON content type are rejected."""
+    with self.client:
+      response = self.client.post(
+        "/acp/checkout_sessions",
+        headers={**self._acp_headers(), "Content-Type": "text/plain"},
+        content=b'{"items": [{"sku": "rose", "quantity": 1}]}',
+      )
+      self.assertEqual(response.status_code, 422)
+      self.assertEqual(response.json()["detail"][0]["loc"], ["body"])
+
+  def test_acp_cancel_accepts_null_body(self) -> None:
+    """Tests that the optional ACP cancel body may be JSON null."""
+    with self.client:
+      session_id = self._create_acp_session()
+      response = self.client.post(
+        f"/acp/checkout_sessions/{session_id}/cancel",
+        headers={**self._acp_headers(), "Content-Type": "application/json"},
+        content=b"null",
+      )
+      self.assertEqual(response.status_code, 200)
+      self.assertEqual(response.json()["status"], "canceled")
+
+  def test_acp_auth_checked_before_body(self) -> None:
+    """Tests that unauthenticated ACP requests fail before body validation."""
+    with self.client:
+      response = self.client.post("/acp/checkout_sessions", json={"items": []})
+      self.assertEqual(response.status_code, 401)
+
+  def test_acp_openapi_body_schemas(self) -> None:
+    """Tests that ACP request bodies are documented as OpenAPI components."""
+    with self.client:
+      response = self.client.get("/openapi.json")
+      self.assertEqual(response.status_code, 200)
+      spec = response.json()
+      schemas = spec["components"]["schemas"]
+      for name in (
+        "ACPCheckoutSessionCreateRequest",
+        "ACPCheckoutSessionUpdateRequest",
+        "ACPCheckoutSessionCompleteRequest",
+        "ACPCancelSessionRequest",
+        "ACPItem",
+        "ACPIntentTrace",
+        "ACPAffiliateAttribution",
+        "ACPPaymentData",
+      ):
+        self.assertIn(name, schemas)
+
+      request_body = spec["paths"]["/acp/checkout_sessions"]["post"][
+        "requestBody"
+      ]
+      self.assertTrue(request_body["required"])
+      self.assertEqual(
+        request_body["content"]["application/json"]["schema"],
+        {"$ref": "#/components/schemas/ACPCheckoutSessionCreateRequest"},
+      )
+
+  def test_acp_complete_rejects_unknown_provider(self) -> None:
+    """Tests that ACP payment data must name a supported provider."""
+    with self.client:
+      session_id = self._create_acp_session()
+      response = self.client.post(
+        f"/acp/checkout_sessions/{session_id}/complete",
+        headers=self._acp_headers(),
+        json={"payment_data": {"token": "spt_123", "provider": "adyen"}},
+      )
+      self.assertEqual(response.status_code, 422)
+      error = response.json()["detail"][0]
+      self.assertEqual(error["type"], "union_tag_invalid")
+      self.assertEqual(error["loc"], ["body", "payment_data"])
+
 
 if __name__ == "__main__":
   absltest.main()
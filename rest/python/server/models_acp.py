@@ -18,14 +18,18 @@ This module defines request/response models for the ACP protocol endpoints,
 following the OpenAPI specification from agentic-commerce-protocol/agentic-commerce-protocol.
 """
 
-from typing import Any, Literal
-from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Annotated, Any, Literal
+from pydantic import BaseModel, ConfigDict, Field
+from typing_extensions import TypeAliasType
 
 
 # --- ACP Item Models ---
 
 class ACPItem(BaseModel):
     """An item in an ACP checkout."""
+    model_config = ConfigDict(frozen=True)
+
     sku: str = Field(..., description="Product SKU identifier")
     quantity: int = Field(1, ge=1, description="Quantity of item")
     price: int | None = Field(None, description="Price in smallest currency unit")
@@ -34,6 +38,8 @@ class ACPItem(BaseModel):
 
 class ACPLineItem(BaseModel):
     """Line item in ACP checkout response."""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     sku: str
     name: str
@@ -46,6 +52,8 @@ class ACPLineItem(BaseModel):
 
 class ACPBuyer(BaseModel):
     """Buyer information for ACP checkout."""
+    model_config = ConfigDict(frozen=True)
+
     email: str | None = None
     name: str | None = None
     phone: str | None = None
@@ -55,6 +63,8 @@ class ACPBuyer(BaseModel):
 
 class ACPAddress(BaseModel):
     """Shipping address for ACP."""
+    model_config = ConfigDict(frozen=True)
+
     line1: str | None = None
     line2: str | None = None
     city: str | None = None
@@ -65,6 +75,8 @@ class ACPAddress(BaseModel):
 
 class ACPFulfillmentOption(BaseModel):
     """A fulfillment option."""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     price: int
@@ -79,14 +91,39 @@ class ACPFulfillmentDetails(BaseModel):
 
 # --- ACP Payment Models ---
 
-class ACPPaymentData(BaseModel):
-    """Payment data for completing checkout."""
+class ACPTokenPaymentData(BaseModel):
+    """Fields shared by the payment data of every provider."""
+    model_config = ConfigDict(frozen=True)
+
     token: str = Field(..., description="SharedPaymentToken from PSP")
-    provider: str = Field(..., description="Payment provider (e.g., 'stripe')")
+
+
+class ACPStripePaymentData(ACPTokenPaymentData):
+    """Stripe payment data for completing checkout."""
+    provider: Literal["stripe"] = Field(..., description="Payment provider")
+
+
+class ACPPaypalPaymentData(ACPTokenPaymentData):
+    """PayPal payment data for completing checkout."""
+    provider: Literal["paypal"] = Field(..., description="Payment provider")
+
+
+# Payment data for completing checkout, tagged by provider so validation goes
+# straight to the matching model instead of trying each union member. The
+# alias keeps ACPPaymentData as a named schema in OpenAPI.
+ACPPaymentData = TypeAliasType(
+    "ACPPaymentData",
+    Annotated[
+        ACPStripePaymentData | ACPPaypalPaymentData,
+        Field(discriminator="provider"),
+    ],
+)
 
 
 class ACPPaymentOption(BaseModel):
     """A payment option."""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     type: str
     provider: str
@@ -96,6 +133,8 @@ class ACPPaymentOption(BaseModel):
 
 class ACPAffiliateAttribution(BaseModel):
     """Affiliate attribution for tracking."""
+    model_config = ConfigDict(frozen=True)
+
     source: str | None = None
     campaign: str | None = None
     medium: str | None = None
@@ -105,6 +144,8 @@ class ACPAffiliateAttribution(BaseModel):
 
 class ACPIntentTrace(BaseModel):
     """Intent trace for cancellation."""
+    model_config = ConfigDict(frozen=True)
+
     reason_code: str | None = None
 
 
@@ -142,9 +183,11 @@ class ACPCancelSessionRequest(BaseModel):
 
 class ACPOrder(BaseModel):
     """Order created after checkout completion."""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     status: str
-    created_at: str | None = None
+    created_at: datetime | None = None
 
 
 class ACPCheckoutSession(BaseModel):
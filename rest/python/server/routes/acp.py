@@ -25,37 +25,96 @@ Endpoints:
 - POST /checkout_sessions/{id}/cancel - Cancel checkout
 """
 
+import asyncio
 import datetime
+import functools
 import logging
 import uuid
-from typing import Annotated
-
-from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from typing import Annotated, Any
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
+from fastapi.exceptions import RequestValidationError
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+import orjson
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from ucp_sdk.models.schemas.shopping.payment_create_req import PaymentCreateRequest
+from ucp_sdk.models.schemas.shopping.payment_update_req import PaymentUpdateRequest
+from ucp_sdk.models.schemas.shopping.types import card_payment_instrument
+from ucp_sdk.models.schemas.shopping.types import item_create_req
+from ucp_sdk.models.schemas.shopping.types import item_update_req
+from ucp_sdk.models.schemas.shopping.types import line_item_create_req
+from ucp_sdk.models.schemas.shopping.types import line_item_update_req
+from ucp_sdk.models.schemas.shopping.types import payment_instrument
+from ucp_sdk.models.schemas.shopping.types import token_credential_resp
+from ucp_sdk.models.schemas.shopping.types.buyer import Buyer
 
 from dependencies import get_checkout_service
+from exceptions import (
+    CheckoutNotModifiableError,
+    FulfillmentRequiredError,
+    ResourceNotFoundError,
+    UcpError,
+)
+from models import (
+    UnifiedCheckout,
+    UnifiedCheckoutCreateRequest,
+    UnifiedCheckoutUpdateRequest,
+)
 from models_acp import (
-    ACPBuyer,
     ACPCancelSessionRequest,
     ACPCheckoutSession,
     ACPCheckoutSessionCompleteRequest,
     ACPCheckoutSessionCreateRequest,
     ACPCheckoutSessionUpdateRequest,
     ACPCheckoutSessionWithOrder,
-    ACPFulfillmentOption,
-    ACPLineItem,
-    ACPOrder,
-    ACPPaymentOption,
 )
 from services.checkout_service import CheckoutService
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/acp", tags=["ACP - Agentic Commerce Protocol"])
+_UTC = datetime.timezone.utc
+
+# Handlers return ready-made dict payloads that ``_json_response`` serializes
+# with orjson, skipping jsonable_encoder and response_model validation. The
+# ACP response models are only referenced for the OpenAPI schema.
+router = APIRouter(
+    prefix="/acp",
+    tags=["ACP - Agentic Commerce Protocol"],
+)
 
 # Bearer token auth
 security = HTTPBearer(auto_error=False)
 
+# Static options offered on every session. They are serialized once at import
+# and orjson splices the bytes into each response as-is.
+_PAYMENT_OPTIONS = orjson.Fragment(orjson.dumps([
+    {"id": "stripe", "type": "card", "provider": "stripe"},
+    {"id": "paypal", "type": "wallet", "provider": "paypal"},
+]))
+
+_FULFILLMENT_OPTIONS = orjson.Fragment(orjson.dumps([
+    {
+        "id": "standard",
+        "name": "Standard Shipping",
+        "price": 999,
+        "estimated_delivery": "5-7 business days",
+    },
+    {
+        "id": "express",
+        "name": "Express Shipping",
+        "price": 1999,
+        "estimated_delivery": "2-3 business days",
+    },
+]))
+
 
 async def verify_acp_auth(
     credentials: HTTPAuthorizationCredentials | None = Depends(security),
@@ -64,116 +123,247 @@ async def verify_acp_auth(
 
     In production, this would validate against a real auth system.
     For demo purposes, we accept any Bearer token.
+
+    This runs on every ACP request and stays ``async`` on purpose: FastAPI
+    awaits async dependencies inline but sends sync ones to a threadpool.
     """
-    if not credentials:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Missing Authorization header",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    # For demo, accept any token. Production would validate against issuer.
-    return credentials.credentials
+    if credentials:
+        # For demo, accept any token. Production would validate against issuer.
+        return credentials.credentials
+    raise HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Missing Authorization header",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _json_response(
+    payload: dict, status_code: int = status.HTTP_200_OK
+) -> Response:
+    """Serialize ``payload`` with orjson into a JSON response."""
+    return Response(
+        orjson.dumps(payload),
+        status_code=status_code,
+        media_type="application/json",
+    )
 
 
-def _map_ucp_status_to_acp(ucp_status: str) -> str:
-    """Map UCP checkout status to ACP status."""
-    mapping = {
-        "in_progress": "open",
-        "ready_for_complete": "open",
-        "completed": "complete",
-        "canceled": "canceled",
+# Request body schemas referenced by ``_json_body_openapi``. FastAPI only
+# registers components for the bodies it parses itself, so server.py merges
+# these in through ``add_body_schema_components``.
+_BODY_SCHEMA_COMPONENTS: dict[str, Any] = {}
+_COMPONENT_REF_TEMPLATE = "#/components/schemas/{model}"
+
+
+def _is_json_content_type(content_type: str | None) -> bool:
+    """Whether FastAPI would decode a body with ``content_type`` as JSON."""
+    if not content_type:
+        return False
+    media_type = content_type.partition(";")[0].strip().lower()
+    maintype, _, subtype = media_type.partition("/")
+    return maintype == "application" and (
+        subtype == "json" or subtype.endswith("+json")
+    )
+
+
+def _json_body(model: type[BaseModel], required: bool = True):
+    """Build a dependency that validates the raw JSON request body as ``model``.
+
+    Pydantic parses and validates the body bytes in a single pass, instead of
+    FastAPI decoding the JSON first and validating the resulting dict. Routes
+    using it describe the body with ``openapi_extra=_json_body_openapi(...)``
+    and declare it after ``verify_acp_auth``, so unauthenticated requests are
+    rejected before the body is parsed.
+    """
+    adapter = TypeAdapter(model if required else model | None)
+
+    async def parse_body(request: Request) -> BaseModel | None:
+        body = await request.body()
+        try:
+            if not body:
+                if not required:
+                    return None
+                raise RequestValidationError(
+                    [
+                        {
+                            "type": "missing",
+                            "loc": ("body",),
+                            "msg": "Field required",
+                            "input": None,
+                        }
+                    ]
+                )
+            if not _is_json_content_type(request.headers.get("content-type")):
+                # FastAPI validates other bodies as raw bytes, which fails.
+                return adapter.validate_python(body, from_attributes=True)
+            return adapter.validate_json(body)
+        except ValidationError as e:
+            # Same shape as FastAPI's own body validation errors.
+            raise RequestValidationError(
+                [
+                    {**error, "loc": ("body", *error["loc"])}
+                    for error in e.errors(include_url=False)
+                ]
+            ) from e
+
+    return parse_body
+
+
+def _json_body_openapi(
+    model: type[BaseModel], required: bool = True
+) -> dict:
+    """Build ``openapi_extra`` documenting ``model`` as the request body."""
+    schema = model.model_json_schema(ref_template=_COMPONENT_REF_TEMPLATE)
+    _BODY_SCHEMA_COMPONENTS.update(schema.pop("$defs", {}))
+    _BODY_SCHEMA_COMPONENTS[model.__name__] = schema
+    body_schema: dict[str, Any] = {
+        "$ref": _COMPONENT_REF_TEMPLATE.format(model=model.__name__)
     }
-    return mapping.get(ucp_status.lower(), "open")
+    request_body: dict[str, Any] = {"required": True}
+    if not required:
+        body_schema = {
+            "anyOf": [body_schema, {"type": "null"}],
+            "title": "Body",
+        }
+        request_body = {}
+    request_body["content"] = {"application/json": {"schema": body_schema}}
+    return {"requestBody": request_body}
 
 
-def _ucp_checkout_to_acp_session(
-    ucp_checkout: dict,
-    fulfillment_options: list[ACPFulfillmentOption] | None = None,
-) -> ACPCheckoutSession:
-    """Convert a UCP checkout response to ACP checkout session format."""
+def add_body_schema_components(openapi_schema: dict) -> None:
+    """Register the ACP request body schemas as OpenAPI components.
 
-    # Map line items
-    acp_items = []
-    for li in ucp_checkout.get("line_items", []):
-        item = li.get("item", {})
-        quantity = li.get("quantity", 1)
-        price = item.get("price", 0)
-        acp_items.append(
-            ACPLineItem(
-                id=li.get("id", str(uuid.uuid4())),
-                sku=item.get("id", ""),
-                name=item.get("title", "Unknown"),
-                quantity=quantity,
-                unit_price=price,
-                total_price=price * quantity,
-            )
-        )
+    Components FastAPI already generated for the response models are kept.
+    """
+    components = openapi_schema.setdefault("components", {}).setdefault(
+        "schemas", {}
+    )
+    for name, schema in _BODY_SCHEMA_COMPONENTS.items():
+        components.setdefault(name, schema)
 
-    # Calculate totals
-    totals = ucp_checkout.get("totals", [])
-    subtotal = next((t["amount"] for t in totals if t["type"] == "subtotal"), 0)
-    total = next((t["amount"] for t in totals if t["type"] == "total"), subtotal)
-    shipping = next((t["amount"] for t in totals if t["type"] == "fulfillment"), None)
-    discount = next((t["amount"] for t in totals if t["type"] == "discount"), None)
 
-    # Map buyer
-    ucp_buyer = ucp_checkout.get("buyer")
-    acp_buyer = None
-    if ucp_buyer:
-        acp_buyer = ACPBuyer(
-            email=ucp_buyer.get("email"),
-            name=ucp_buyer.get("name"),
-            phone=ucp_buyer.get("phone"),
-        )
+# Field names of the session response models, read once so payload builders
+# don't go through model_fields on every request.
+_SESSION_FIELDS = tuple(ACPCheckoutSession.model_fields)
+_SESSION_WITH_ORDER_FIELDS = tuple(ACPCheckoutSessionWithOrder.model_fields)
 
-    # Standard payment options
-    payment_options = [
-        ACPPaymentOption(id="stripe", type="card", provider="stripe"),
-        ACPPaymentOption(id="paypal", type="wallet", provider="paypal"),
+# UCP checkout status -> ACP session status. UCP statuses are lowercase
+# literals, so lookups need no case folding.
+_UCP_TO_ACP_STATUS = {
+    "in_progress": "open",
+    "ready_for_complete": "open",
+    "completed": "complete",
+    "canceled": "canceled",
+}
+
+
+def _ucp_checkout_to_acp_session(
+    ucp_checkout: UnifiedCheckout,
+    fulfillment_options: orjson.Fragment | None = None,
+    order: dict | None = None,
+) -> dict:
+    """Convert a UCP checkout response to an ACP checkout session payload.
+
+    The result is a plain dict shaped like ``ACPCheckoutSession``, or like
+    ``ACPCheckoutSessionWithOrder`` when ``order`` is given. Only the fields
+    ACP needs are read off the checkout model, instead of dumping the whole
+    checkout first; it comes from our own checkout service, so it is not
+    re-validated.
+    """
+
+    # Map line items
+    acp_items = [
+        {
+            "id": li.id,
+            "sku": (item := li.item).id,
+            "name": item.title,
+            "quantity": (quantity := li.quantity),
+            "unit_price": (price := item.price),
+            "total_price": price * quantity,
+        }
+        for li in ucp_checkout.line_items
     ]
 
-    return ACPCheckoutSession(
-        id=ucp_checkout.get("id", ""),
-        status=_map_ucp_status_to_acp(ucp_checkout.get("status", "in_progress")),
+    # Calculate totals in one pass. Walk in reverse so the first entry of each
+    # type wins when the service emits several (e.g. one per fulfillment group).
+    totals_by_type = {t.type: t.amount for t in reversed(ucp_checkout.totals)}
+    subtotal = totals_by_type.get("subtotal", 0)
+    total = totals_by_type.get("total", subtotal)
+    shipping = totals_by_type.get("fulfillment")
+    discount = totals_by_type.get("discount")
+
+    # Map buyer. "name" and "phone" are extra fields, not part of the UCP
+    # buyer schema, so they may be absent.
+    ucp_buyer = ucp_checkout.buyer
+    acp_buyer = None
+    if ucp_buyer:
+        acp_buyer = {
+            "email": ucp_buyer.email,
+            "name": getattr(ucp_buyer, "name", None),
+            "phone": getattr(ucp_buyer, "phone", None),
+        }
+
+    # Seed every documented field so fields ACP has no UCP source for (e.g.
+    # tax, metadata) are still present as null.
+    session = dict.fromkeys(
+        _SESSION_FIELDS if order is None else _SESSION_WITH_ORDER_FIELDS
+    )
+    session.update(
+        id=ucp_checkout.id,
+        status=_UCP_TO_ACP_STATUS.get(ucp_checkout.status, "open"),
         items=acp_items,
         subtotal=subtotal,
         total=total,
-        currency=ucp_checkout.get("currency", "USD"),
+        currency=ucp_checkout.currency,
         buyer=acp_buyer,
         fulfillment_options=fulfillment_options,
-        payment_options=payment_options,
+        payment_options=_PAYMENT_OPTIONS,
         shipping_cost=shipping,
         discount=discount,
     )
+    if order is not None:
+        session["order"] = order
+    return session
+
+
+async def _resolve_fulfillment_options(
+    currency: str, region: str | None
+) -> orjson.Fragment:
+    """Return the fulfillment options offered on a new checkout session.
+
+    The options are static for now. This is where a currency or region aware
+    lookup belongs; create_checkout_session runs it concurrently with the
+    checkout creation, so any I/O here overlaps with the service call.
+    """
+    del currency, region  # Unused until options vary by market.
+    return _FULFILLMENT_OPTIONS
 
 
 @router.post(
     "/checkout_sessions",
-    response_model=ACPCheckoutSession,
     status_code=status.HTTP_201_CREATED,
+    response_model=None,
+    responses={status.HTTP_201_CREATED: {"model": ACPCheckoutSession}},
     summary="Create Checkout Session",
     description="Create a new ACP checkout session with items.",
+    openapi_extra=_json_body_openapi(ACPCheckoutSessionCreateRequest),
 )
 async def create_checkout_session(
     request: Request,
-    body: ACPCheckoutSessionCreateRequest,
     checkout_service: CheckoutService = Depends(get_checkout_service),
     api_version: str = Header(default="2026-01-16", alias="API-Version"),
     idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
     _token: str = Depends(verify_acp_auth),
-):
+    body: ACPCheckoutSessionCreateRequest = Depends(
+        _json_body(ACPCheckoutSessionCreateRequest)
+    ),
+) -> Response:
     """Create an ACP checkout session.
 
     Translates ACP request to internal UCP format and creates checkout.
     """
     logger.info("ACP: Creating checkout session with %d items", len(body.items))
 
-    # Import here to avoid circular imports
-    from models import UnifiedCheckoutCreateRequest
-    from ucp_sdk.models.schemas.shopping.types import item_create_req
-    from ucp_sdk.models.schemas.shopping.types import line_item_create_req
-    from ucp_sdk.models.schemas.shopping.payment_create_req import PaymentCreateRequest
-
     # Convert ACP items to UCP line items
     line_items = []
     for acp_item in body.items:
@@ -195,36 +385,26 @@ async def create_checkout_session(
 
     # Add buyer if provided
     if body.buyer:
-        from ucp_sdk.models.schemas.shopping.types.buyer import Buyer
         ucp_request.buyer = Buyer(
             email=body.buyer.email,
             name=body.buyer.name,
         )
 
     # Generate idempotency key if not provided
-    idem_key = idempotency_key or f"acp_{uuid.uuid4()}"
+    idem_key = idempotency_key or f"acp_{uuid.uuid4().hex}"
 
     try:
-        checkout = await checkout_service.create_checkout(ucp_request, idem_key)
-        checkout_dict = checkout.model_dump(mode="json", by_alias=True)
-
-        # Generate fulfillment options
-        fulfillment_options = [
-            ACPFulfillmentOption(
-                id="standard",
-                name="Standard Shipping",
-                price=999,
-                estimated_delivery="5-7 business days",
-            ),
-            ACPFulfillmentOption(
-                id="express",
-                name="Express Shipping",
-                price=1999,
-                estimated_delivery="2-3 business days",
-            ),
-        ]
-
-        return _ucp_checkout_to_acp_session(checkout_dict, fulfillment_options)
+        checkout, fulfillment_options = await asyncio.gather(
+            checkout_service.create_checkout(ucp_request, idem_key),
+            _resolve_fulfillment_options(ucp_request.currency, None),
+        )
+
+        return _json_response(
+            _ucp_checkout_to_acp_session(checkout, fulfillment_options),
+            status_code=status.HTTP_201_CREATED,
+        )
+    except UcpError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
         logger.error("ACP create checkout failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
@@ -232,7 +412,8 @@ async def create_checkout_session(
 
 @router.get(
     "/checkout_sessions/{checkout_session_id}",
-    response_model=ACPCheckoutSession,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": ACPCheckoutSession}},
     summary="Retrieve Checkout Session",
     description="Retrieve an existing ACP checkout session by ID.",
 )
@@ -241,47 +422,46 @@ async def get_checkout_session(
     checkout_service: CheckoutService = Depends(get_checkout_service),
     api_version: str = Header(default="2026-01-16", alias="API-Version"),
     _token: str = Depends(verify_acp_auth),
-):
+) -> Response:
     """Retrieve an ACP checkout session."""
     logger.info("ACP: Getting checkout session %s", checkout_session_id)
 
     try:
         checkout = await checkout_service.get_checkout(checkout_session_id)
-        checkout_dict = checkout.model_dump(mode="json", by_alias=True)
-        return _ucp_checkout_to_acp_session(checkout_dict)
+        return _json_response(_ucp_checkout_to_acp_session(checkout))
+    except ResourceNotFoundError:
+        raise HTTPException(status_code=404, detail="Checkout session not found")
+    except UcpError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
         logger.error("ACP get checkout failed: %s", e)
-        if "not found" in str(e).lower():
-            raise HTTPException(status_code=404, detail="Checkout session not found")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post(
     "/checkout_sessions/{checkout_session_id}",
-    response_model=ACPCheckoutSession,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": ACPCheckoutSession}},
     summary="Update Checkout Session",
     description="Update an existing ACP checkout session.",
+    openapi_extra=_json_body_openapi(ACPCheckoutSessionUpdateRequest),
 )
 async def update_checkout_session(
     checkout_session_id: str,
-    body: ACPCheckoutSessionUpdateRequest,
     checkout_service: CheckoutService = Depends(get_checkout_service),
     api_version: str = Header(default="2026-01-16", alias="API-Version"),
     idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
     _token: str = Depends(verify_acp_auth),
-):
+    body: ACPCheckoutSessionUpdateRequest = Depends(
+        _json_body(ACPCheckoutSessionUpdateRequest)
+    ),
+) -> Response:
     """Update an ACP checkout session."""
     logger.info("ACP: Updating checkout session %s", checkout_session_id)
 
-    from models import UnifiedCheckoutUpdateRequest
-    from ucp_sdk.models.schemas.shopping.types import item_update_req
-    from ucp_sdk.models.schemas.shopping.types import line_item_update_req
-    from ucp_sdk.models.schemas.shopping.payment_update_req import PaymentUpdateRequest
-
     # First, get the existing checkout to merge updates
     try:
         existing_checkout = await checkout_service.get_checkout(checkout_session_id)
-        existing_dict = existing_checkout.model_dump(mode="json")
     except Exception:
         raise HTTPException(status_code=404, detail="Checkout session not found")
 
@@ -298,67 +478,70 @@ async def update_checkout_session(
                 )
             )
     else:
-        # Keep existing line items
-        for li in existing_dict.get("line_items", []):
-            item = li.get("item", {})
+        # Keep existing line items. These come from the stored checkout, which
+        # the service already validated, so skip re-validation.
+        for li in existing_checkout.line_items:
             line_items.append(
-                line_item_update_req.LineItemUpdateRequest(
-                    id=li.get("id"),
-                    item=item_update_req.ItemUpdateRequest(
-                        id=item.get("id"), title=item.get("title", "")
+                line_item_update_req.LineItemUpdateRequest.model_construct(
+                    id=li.id,
+                    item=item_update_req.ItemUpdateRequest.model_construct(
+                        id=li.item.id, title=li.item.title
                     ),
-                    quantity=li.get("quantity", 1),
+                    quantity=li.quantity,
                 )
             )
 
     # Handle buyer update
     buyer = None
     if body.buyer:
-        from ucp_sdk.models.schemas.shopping.types.buyer import Buyer
         buyer = Buyer(
             email=body.buyer.email,
             name=body.buyer.name,
         )
-    elif existing_dict.get("buyer"):
-        from ucp_sdk.models.schemas.shopping.types.buyer import Buyer
-        buyer = Buyer(**existing_dict["buyer"])
+    elif existing_checkout.buyer:
+        buyer = existing_checkout.buyer
 
     ucp_request = UnifiedCheckoutUpdateRequest(
         id=checkout_session_id,
         line_items=line_items,
-        currency=existing_dict.get("currency", "USD"),
+        currency=existing_checkout.currency,
         payment=PaymentUpdateRequest(),
         buyer=buyer,
     )
-    idem_key = idempotency_key or f"acp_upd_{uuid.uuid4()}"
+    idem_key = idempotency_key or f"acp_upd_{uuid.uuid4().hex}"
 
     try:
         checkout = await checkout_service.update_checkout(
             checkout_session_id, ucp_request, idem_key
         )
-        checkout_dict = checkout.model_dump(mode="json", by_alias=True)
-        return _ucp_checkout_to_acp_session(checkout_dict)
+        return _json_response(_ucp_checkout_to_acp_session(checkout))
+    except ResourceNotFoundError:
+        raise HTTPException(status_code=404, detail="Checkout session not found")
+    except UcpError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
         logger.error("ACP update checkout failed: %s", e)
-        if "not found" in str(e).lower():
-            raise HTTPException(status_code=404, detail="Checkout session not found")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post(
     "/checkout_sessions/{checkout_session_id}/complete",
-    response_model=ACPCheckoutSessionWithOrder,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": ACPCheckoutSessionWithOrder}},
     summary="Complete Checkout Session",
     description="Complete checkout with SharedPaymentToken.",
+    openapi_extra=_json_body_openapi(ACPCheckoutSessionCompleteRequest),
 )
 async def complete_checkout_session(
     checkout_session_id: str,
-    body: ACPCheckoutSessionCompleteRequest,
     checkout_service: CheckoutService = Depends(get_checkout_service),
     api_version: str = Header(default="2026-01-16", alias="API-Version"),
     idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
     _token: str = Depends(verify_acp_auth),
-):
+    body: ACPCheckoutSessionCompleteRequest = Depends(
+        _json_body(ACPCheckoutSessionCompleteRequest)
+    ),
+) -> Response:
     """Complete an ACP checkout session with payment.
 
     This endpoint accepts a SharedPaymentToken from the payment provider
@@ -366,27 +549,30 @@ async def complete_checkout_session(
     """
     logger.info("ACP: Completing checkout session %s", checkout_session_id)
 
-    from ucp_sdk.models.schemas.shopping.payment_create_req import PaymentCreateRequest
-    from ucp_sdk.models.schemas.shopping.types import payment_instrument
-
     # Map ACP payment to UCP format
-    instrument_id = str(uuid.uuid4())
+    instrument_id = uuid.uuid4().hex
 
-    # Create payment instrument with the SharedPaymentToken
+    # Create payment instrument with the SharedPaymentToken. The token carries
+    # no card details, so brand and last digits are placeholders.
     payment_request = PaymentCreateRequest(
         selected_instrument_id=instrument_id,
         instruments=[
             payment_instrument.PaymentInstrument(
-                root=payment_instrument.TokenPaymentInstrument(
+                root=card_payment_instrument.CardPaymentInstrument(
                     id=instrument_id,
                     handler_id="mock_payment_handler",  # For demo
-                    credential={"token": "success_token"},  # Mock success
+                    type="card",
+                    brand="unknown",
+                    last_digits="0000",
+                    credential=token_credential_resp.TokenCredentialResponse(
+                        type="token", token="success_token"  # Mock success
+                    ),
                 )
             )
         ],
     )
 
-    idem_key = idempotency_key or f"acp_complete_{uuid.uuid4()}"
+    idem_key = idempotency_key or f"acp_complete_{uuid.uuid4().hex}"
 
     try:
         checkout = await checkout_service.complete_checkout(
@@ -395,73 +581,74 @@ async def complete_checkout_session(
             risk_signals={},
             idempotency_key=idem_key,
         )
-        checkout_dict = checkout.model_dump(mode="json", by_alias=True)
 
         # Build response with order
-        acp_session = _ucp_checkout_to_acp_session(checkout_dict)
-
-        # Add order info
-        order_info = checkout_dict.get("order", {})
-        order = ACPOrder(
-            id=order_info.get("id", str(uuid.uuid4())),
-            status="confirmed",
-            created_at=datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        order = {
+            "id": checkout.order.id if checkout.order else uuid.uuid4().hex,
+            "status": "confirmed",
+            "created_at": datetime.datetime.now(_UTC),
+        }
+
+        return _json_response(
+            _ucp_checkout_to_acp_session(checkout, order=order)
         )
-
-        return ACPCheckoutSessionWithOrder(
-            **acp_session.model_dump(),
-            order=order,
+    except ResourceNotFoundError:
+        raise HTTPException(status_code=404, detail="Checkout session not found")
+    except CheckoutNotModifiableError:
+        raise HTTPException(
+            status_code=409, detail="Checkout already completed or canceled"
+        )
+    except FulfillmentRequiredError:
+        raise HTTPException(
+            status_code=400,
+            detail="Fulfillment address and option must be selected"
         )
+    except UcpError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
         logger.error("ACP complete checkout failed: %s", e)
-        error_msg = str(e).lower()
-        if "not found" in error_msg:
-            raise HTTPException(status_code=404, detail="Checkout session not found")
-        if "not modifiable" in error_msg:
-            raise HTTPException(status_code=409, detail="Checkout already completed")
-        if "fulfillment" in error_msg:
-            raise HTTPException(
-                status_code=400,
-                detail="Fulfillment address and option must be selected"
-            )
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post(
     "/checkout_sessions/{checkout_session_id}/cancel",
-    response_model=ACPCheckoutSession,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": ACPCheckoutSession}},
     summary="Cancel Checkout Session",
     description="Cancel an existing checkout session.",
+    openapi_extra=_json_body_openapi(ACPCancelSessionRequest, required=False),
 )
 async def cancel_checkout_session(
     checkout_session_id: str,
-    body: ACPCancelSessionRequest | None = None,
     checkout_service: CheckoutService = Depends(get_checkout_service),
     api_version: str = Header(default="2026-01-16", alias="API-Version"),
     idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
     _token: str = Depends(verify_acp_auth),
-):
+    body: ACPCancelSessionRequest | None = Depends(
+        _json_body(ACPCancelSessionRequest, required=False)
+    ),
+) -> Response:
     """Cancel an ACP checkout session."""
     logger.info("ACP: Canceling checkout session %s", checkout_session_id)
 
-    idem_key = idempotency_key or f"acp_cancel_{uuid.uuid4()}"
+    idem_key = idempotency_key or f"acp_cancel_{uuid.uuid4().hex}"
 
     try:
         checkout = await checkout_service.cancel_checkout(
             checkout_session_id, idem_key
         )
-        checkout_dict = checkout.model_dump(mode="json", by_alias=True)
-        return _ucp_checkout_to_acp_session(checkout_dict)
+        return _json_response(_ucp_checkout_to_acp_session(checkout))
+    except ResourceNotFoundError:
+        raise HTTPException(status_code=404, detail="Checkout session not found")
+    except CheckoutNotModifiableError:
+        raise HTTPException(
+            status_code=405,
+            detail="Checkout session cannot be canceled (already completed or canceled)",
+        )
+    except UcpError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
         logger.error("ACP cancel checkout failed: %s", e)
-        error_msg = str(e).lower()
-        if "not found" in error_msg:
-            raise HTTPException(status_code=404, detail="Checkout session not found")
-        if "not modifiable" in error_msg or "cannot cancel" in error_msg:
-            raise HTTPException(
-                status_code=405,
-                detail="Checkout session cannot be canceled (already completed or canceled)",
-            )
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -471,12 +658,22 @@ async def cancel_checkout_session(
     "/.well-known/acp",
     summary="ACP Discovery",
     description="Returns ACP capabilities and endpoints.",
+    response_model=None,
 )
-async def acp_discovery(request: Request):
+async def acp_discovery(request: Request) -> Response:
     """Return ACP discovery document."""
     base_url = str(request.base_url).rstrip("/")
+    return Response(_discovery_payload(base_url), media_type="application/json")
 
-    return {
+
+@functools.lru_cache(maxsize=16)
+def _discovery_payload(base_url: str) -> bytes:
+    """Build the serialized discovery document for ``base_url``.
+
+    The document only depends on the host, so it is serialized once per
+    base URL and served as-is afterwards.
+    """
+    return orjson.dumps({
         "protocol": "acp",
         "version": "2026-01-16",
         "merchant": {
@@ -496,4 +693,4 @@ async def acp_discovery(request: Request):
         },
         "payment_providers": ["stripe", "paypal"],
         "fulfillment_options": ["standard", "express"],
-    }
+    })
@@ -17,6 +17,7 @@
 import logging
 import sys
 from collections.abc import Sequence
+from typing import Any
 from absl import app as absl_app
 import config
 from exceptions import UcpError
@@ -27,6 +28,7 @@ from fastapi.middleware.cors import CORSMiddleware
 import generated_routes.ucp_routes
 from routes.discovery import router as discovery_router
 from routes.order import router as order_router
+from routes.acp import add_body_schema_components
 from routes.acp import router as acp_router
 import routes.ucp_implementation
 import uvicorn
@@ -72,6 +74,18 @@ app.include_router(order_router)
 app.include_router(discovery_router)
 app.include_router(acp_router)  # ACP Protocol endpoints
 
+_default_openapi = app.openapi
+
+
+def _openapi() -> dict[str, Any]:
+  """Generate the OpenAPI schema, including the ACP request body models."""
+  if app.openapi_schema is None:
+    add_body_schema_components(_default_openapi())
+  return app.openapi_schema
+
+
+app.openapi = _openapi
+
 
 def main(argv: Sequence[str]) -> None:
   """Run the UCP Merchant Server."""
@@ -41,6 +41,7 @@ import config
 import db
 from enums import CheckoutStatus
 from exceptions import CheckoutNotModifiableError
+from exceptions import FulfillmentRequiredError
 from exceptions import IdempotencyConflictError
 from exceptions import InvalidRequestError
 from exceptions import OutOfStockError
@@ -668,7 +669,7 @@ class CheckoutService:
           break
 
     if not fulfillment_valid:
-      raise InvalidRequestError(
+      raise FulfillmentRequiredError(
         "Fulfillment address and option must be selected before completion."
       )
 